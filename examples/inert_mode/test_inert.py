@@ -5,24 +5,23 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[2]
 TESTS_DIR = ROOT / "tests"
 if str(TESTS_DIR) not in sys.path:
     sys.path.insert(0, str(TESTS_DIR))
 
-from support.assertions import assert_ok, list_devices_entries, require_signal  # noqa: E402
+from support.assertions import assert_ok, list_devices_entries, require_signals  # noqa: E402
 from support.env import repo_root, resolve_config_path, resolve_provider_executable  # noqa: E402
-from support.framed_client import AdppClient, make_string_value  # noqa: E402
+from support.framed_client import AdppClient  # noqa: E402
 from support.proto_bootstrap import load_protocol_module  # noqa: E402
 
 
-def _read_temp_pair(client: AdppClient) -> tuple[float, float]:
-    resp = client.read_signals("tempctl0", ["tc1_temp", "tc2_temp"])
+def _temp_pair(resp: Any) -> tuple[float, float]:
     assert_ok(resp, "read_signals tempctl0")
-    tc1 = float(require_signal(resp, "tc1_temp").value.double_value)
-    tc2 = float(require_signal(resp, "tc2_temp").value.double_value)
-    return tc1, tc2
+    tc1, tc2 = require_signals(resp, "tc1_temp", "tc2_temp")
+    return float(tc1.value.double_value), float(tc2.value.double_value)
 
 
 def run_inert_example() -> int:
@@ -46,7 +45,7 @@ def run_inert_example() -> int:
         hello = client.hello(client_name="inert-example", client_version="1.0.0")
         assert_ok(hello, "hello")
 
-        listed = client.list_devices(include_health=False)
+        listed = client.list_devices()
         assert_ok(listed, "list_devices")
         device_ids = [entry.device_id for entry in list_devices_entries(listed)]
         print(f"Devices: {device_ids}")
@@ -56,17 +55,20 @@ def run_inert_example() -> int:
         if missing:
             raise RuntimeError(f"Missing expected devices: {missing}")
 
-        before = _read_temp_pair(client)
+        # Inert mode has no ticker, so read/call/read can be pipelined as one batch.
+        before_resp, call_resp, after_resp = client.send_batch(
+            [
+                client.build_read_signals("tempctl0", ["tc1_temp", "tc2_temp"]),
+                client.build_call_function("tempctl0", 1, {"mode": "closed"}),
+                client.build_read_signals("tempctl0", ["tc1_temp", "tc2_temp"]),
+            ]
+        )
+        before = _temp_pair(before_resp)
         print(f"Initial temperatures: tc1={before[0]:.1f} C tc2={before[1]:.1f} C")
 
-        call_resp = client.call_function(
-            "tempctl0",
-            1,
-            {"mode": make_string_value(protocol, "closed")},
-        )
         assert_ok(call_resp, "call set_mode closed")
 
-        after = _read_temp_pair(client)
+        after = _temp_pair(after_resp)
         print(f"After set_mode call: tc1={after[0]:.1f} C tc2={after[1]:.1f} C")
 
         if after != before:
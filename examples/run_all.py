@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Run the mode examples concurrently and report a combined result.
+
+Each example owns its provider (and FluxGraph server) child, so they are
+independent and total wall time is the slowest example rather than the sum.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+EXAMPLES_DIR = Path(__file__).resolve().parent
+
+EXAMPLES = [
+    "inert_mode/test_inert.py",
+    "non_interacting_mode/test_non_interacting.py",
+]
+SIM_EXAMPLE = "sim_mode/test_sim.py"
+# Wall-clock budget for the whole concurrent run; a hung example is killed after it.
+DEFAULT_TIMEOUT_SEC = 180.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run provider-sim mode examples concurrently")
+    parser.add_argument(
+        "--with-sim",
+        action="store_true",
+        help="Also run sim_mode (requires a FluxGraph-enabled build and fluxgraph-server)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT_SEC,
+        help=f"Seconds before unfinished examples are killed (default: {DEFAULT_TIMEOUT_SEC:g})",
+    )
+    args = parser.parse_args()
+
+    scripts = EXAMPLES + ([SIM_EXAMPLE] if args.with_sim else [])
+    # Spool output to temp files so no child can stall on a full pipe while
+    # an earlier example is still being waited on.
+    logs = [tempfile.TemporaryFile(mode="w+") for _ in scripts]
+    procs = [
+        subprocess.Popen(
+            [sys.executable, str(EXAMPLES_DIR / script)],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        for script, log in zip(scripts, logs)
+    ]
+
+    # The examples run side by side, so one deadline bounds them all.
+    deadline = time.monotonic() + args.timeout
+    failed: list[str] = []
+    for script, proc, log in zip(scripts, procs, logs):
+        timed_out = False
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            proc.kill()
+            proc.wait()
+        log.seek(0)
+        output = log.read()
+        log.close()
+        status = f"killed after {args.timeout:g}s timeout" if timed_out else f"exit {proc.returncode}"
+        print(f"----- {script} ({status}) -----")
+        print(output, end="" if output.endswith("\n") else "\n")
+        if timed_out or proc.returncode != 0:
+            failed.append(script)
+
+    if failed:
+        print(f"[FAIL] {len(failed)}/{len(scripts)} examples failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    print(f"[PASS] {len(scripts)} examples passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
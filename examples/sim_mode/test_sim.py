@@ -7,6 +7,7 @@ import argparse
 import sys
 import time
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[2]
 TESTS_DIR = ROOT / "tests"
@@ -21,13 +22,13 @@ from support.env import (  # noqa: E402
     resolve_fluxgraph_server,
     resolve_fluxgraph_provider_executable,
 )
-from support.framed_client import AdppClient, make_double_value, make_string_value  # noqa: E402
+from support.framed_client import AdppClient  # noqa: E402
 from support.process import ManagedTextProcess  # noqa: E402
 from support.proto_bootstrap import load_protocol_module  # noqa: E402
 
 
-def _read_temp(client: AdppClient) -> float:
-    resp = client.read_signals("chamber", ["tc1_temp"])
+def _read_temp(client: AdppClient, scratch: Any | None = None) -> float:
+    resp = client.read_signals("chamber", ["tc1_temp"], into=scratch)
     assert_ok(resp, "read chamber tc1_temp")
     return float(require_signal(resp, "tc1_temp").value.double_value)
 
@@ -79,29 +80,37 @@ def run_sim_example(duration_sec: int, port: int) -> int:
         resp = client.call_function(
             "chamber",
             1,
-            {"mode": make_string_value(protocol, "closed")},
+            {"mode": "closed"},
         )
         assert_ok(resp, "set_mode closed")
 
         resp = client.call_function(
             "chamber",
             2,
-            {"value": make_double_value(protocol, 80.0)},
+            {"value": 80.0},
         )
         assert_ok(resp, "set_setpoint 80")
 
-        deadline = time.time() + max(duration_sec, 5)
+        scratch = protocol.Response()
+        deadline = time.monotonic() + max(duration_sec, 5)
         observed_max = baseline
-        samples = 0
-        while time.time() < deadline:
-            current = _read_temp(client)
-            observed_max = max(observed_max, current)
-            samples += 1
-            print(f"temp sample {samples}: {current:.2f} C")
-            if current >= baseline + 1.0:
-                break
-            time.sleep(0.5)
-        else:
+        sample_log: list[str] = []
+        risen = False
+        try:
+            while time.monotonic() < deadline:
+                current = _read_temp(client, scratch)
+                observed_max = max(observed_max, current)
+                sample_log.append(f"temp sample {len(sample_log) + 1}: {current:.2f} C")
+                if current >= baseline + 1.0:
+                    risen = True
+                    break
+                time.sleep(0.5)
+        finally:
+            # Emit the sample trace in one write instead of a print per poll;
+            # a failed read must not lose the samples taken before it.
+            if sample_log:
+                print("\n".join(sample_log))
+        if not risen:
             raise RuntimeError(
                 "Simulation progression assertion failed: expected >=1.0 C rise "
                 f"(initial={baseline:.2f}, max={observed_max:.2f})"
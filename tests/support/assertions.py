@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+import operator
+from typing import Any, Callable
 
 OK_CODE = 1
 
+# (response type, payload kind) -> getter for the payload's repeated entries,
+# resolved on first use so the schema-name fallback is probed once, not per call.
+_ENTRY_GETTERS: dict[tuple[type, str], Callable[[Any], Any]] = {}
+
 
 def status_text(resp: Any) -> str:
     return f"code={resp.status.code} message='{resp.status.message}'"
@@ -21,20 +26,26 @@ def assert_ok(resp: Any, context: str) -> None:
     assert_status(resp, OK_CODE, context)
 
 
+def _payload_entries(resp: Any, kind: str, entries: str) -> Any:
+    key = (type(resp), kind)
+    getter = _ENTRY_GETTERS.get(key)
+    if getter is None:
+        for payload in (kind, f"{kind}_result"):
+            if hasattr(resp, payload):
+                getter = operator.attrgetter(f"{payload}.{entries}")
+                break
+        else:
+            raise AttributeError(f"Response has no {kind} payload")
+        _ENTRY_GETTERS[key] = getter
+    return getter(resp)
+
+
 def list_devices_entries(resp: Any):
-    if hasattr(resp, "list_devices"):
-        return resp.list_devices.devices
-    if hasattr(resp, "list_devices_result"):
-        return resp.list_devices_result.devices
-    raise AttributeError("Response has no list_devices payload")
+    return _payload_entries(resp, "list_devices", "devices")
 
 
 def read_signal_entries(resp: Any):
-    if hasattr(resp, "read_signals"):
-        return resp.read_signals.values
-    if hasattr(resp, "read_signals_result"):
-        return resp.read_signals_result.values
-    raise AttributeError("Response has no read_signals payload")
+    return _payload_entries(resp, "read_signals", "values")
 
 
 def require_signal(resp: Any, signal_id: str):
@@ -42,3 +53,17 @@ def require_signal(resp: Any, signal_id: str):
         if entry.signal_id == signal_id:
             return entry
     raise AssertionError(f"Signal '{signal_id}' not found in read response")
+
+
+def signal_map(resp: Any) -> dict[str, Any]:
+    """Index read_signals entries by signal_id in a single pass."""
+    return {entry.signal_id: entry for entry in read_signal_entries(resp)}
+
+
+def require_signals(resp: Any, *signal_ids: str) -> list[Any]:
+    """Return entries for several signals, scanning the response only once."""
+    by_id = signal_map(resp)
+    missing = [signal_id for signal_id in signal_ids if signal_id not in by_id]
+    if missing:
+        raise AssertionError(f"Signals {missing} not found in read response")
+    return [by_id[signal_id] for signal_id in signal_ids]
@@ -6,45 +6,67 @@ import os
 import socket
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Build-tree locations probed for the provider executable, relative to the repo root.
+_PROVIDER_CANDIDATES = (
+    "build/Release/anolis-provider-sim.exe",
+    "build/Debug/anolis-provider-sim.exe",
+    "build/anolis-provider-sim",
+    "build-tsan/anolis-provider-sim",
+    "build/dev-release/anolis-provider-sim",
+    "build/dev-debug/anolis-provider-sim",
+    "build/dev-release-fluxgraph/anolis-provider-sim",
+    "build/dev-windows-release/Release/anolis-provider-sim.exe",
+    "build/dev-windows-debug/Debug/anolis-provider-sim.exe",
+    "build/dev-windows-release-fluxgraph/Release/anolis-provider-sim.exe",
+    "build/ci-linux-release/anolis-provider-sim",
+    "build/ci-linux-release-strict/anolis-provider-sim",
+    "build/ci-windows-release/Release/anolis-provider-sim.exe",
+    "build/ci-windows-release-strict/Release/anolis-provider-sim.exe",
+    "build/ci-linux-release-fluxgraph/anolis-provider-sim",
+    "build/ci-linux-release-fluxgraph-strict/anolis-provider-sim",
+)
+
+_FLUXGRAPH_PROVIDER_CANDIDATES = (
+    "build/dev-release-fluxgraph/anolis-provider-sim",
+    "build/dev-windows-release-fluxgraph/Release/anolis-provider-sim.exe",
+    "build/ci-linux-release-fluxgraph/anolis-provider-sim",
+    "build/ci-linux-release-fluxgraph-strict/anolis-provider-sim",
+    "build/ci-windows-release-fluxgraph/Release/anolis-provider-sim.exe",
+    "build/ci-windows-release-fluxgraph-strict/Release/anolis-provider-sim.exe",
+)
+
 
 def repo_root() -> Path:
     """Return repository root path."""
-    return Path(__file__).resolve().parents[2]
+    return _REPO_ROOT
+
+
+def _env_override_path(var: str, root: Path) -> Path | None:
+    """Return the resolved path named by an environment override, if set."""
+    env_path = os.environ.get(var)
+    if not env_path:
+        return None
+    candidate = Path(env_path)
+    if not candidate.is_absolute():
+        candidate = root / candidate
+    if candidate.exists():
+        return candidate.resolve()
+    raise FileNotFoundError(f"{var} points to missing file: {candidate}")
 
 
 def resolve_provider_executable(root: Path | None = None) -> Path:
     """Resolve provider executable path from env var or common build locations."""
     root = root or repo_root()
 
-    env_path = os.environ.get("ANOLIS_PROVIDER_SIM_EXE")
-    if env_path:
-        candidate = Path(env_path)
-        if not candidate.is_absolute():
-            candidate = root / candidate
-        if candidate.exists():
-            return candidate.resolve()
-        raise FileNotFoundError(f"ANOLIS_PROVIDER_SIM_EXE points to missing file: {candidate}")
-
-    candidates = [
-        root / "build" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "Debug" / "anolis-provider-sim.exe",
-        root / "build" / "anolis-provider-sim",
-        root / "build-tsan" / "anolis-provider-sim",
-        root / "build" / "dev-release" / "anolis-provider-sim",
-        root / "build" / "dev-debug" / "anolis-provider-sim",
-        root / "build" / "dev-release-fluxgraph" / "anolis-provider-sim",
-        root / "build" / "dev-windows-release" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "dev-windows-debug" / "Debug" / "anolis-provider-sim.exe",
-        root / "build" / "dev-windows-release-fluxgraph" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "ci-linux-release" / "anolis-provider-sim",
-        root / "build" / "ci-linux-release-strict" / "anolis-provider-sim",
-        root / "build" / "ci-windows-release" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "ci-windows-release-strict" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "ci-linux-release-fluxgraph" / "anolis-provider-sim",
-        root / "build" / "ci-linux-release-fluxgraph-strict" / "anolis-provider-sim",
-    ]
+    override = _env_override_path("ANOLIS_PROVIDER_SIM_EXE", root)
+    if override is not None:
+        return override
+
+    candidates = [root / rel for rel in _PROVIDER_CANDIDATES]
     for candidate in candidates:
-        if candidate.exists():
+        if candidate.is_file():
             return candidate.resolve()
 
     candidate_text = "\n".join(f"  - {path}" for path in candidates)
@@ -55,25 +77,13 @@ def resolve_fluxgraph_provider_executable(root: Path | None = None) -> Path:
     """Resolve a FluxGraph-enabled provider executable for sim-mode workflows."""
     root = root or repo_root()
 
-    env_path = os.environ.get("ANOLIS_PROVIDER_SIM_EXE")
-    if env_path:
-        candidate = Path(env_path)
-        if not candidate.is_absolute():
-            candidate = root / candidate
-        if candidate.exists():
-            return candidate.resolve()
-        raise FileNotFoundError(f"ANOLIS_PROVIDER_SIM_EXE points to missing file: {candidate}")
-
-    candidates = [
-        root / "build" / "dev-release-fluxgraph" / "anolis-provider-sim",
-        root / "build" / "dev-windows-release-fluxgraph" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "ci-linux-release-fluxgraph" / "anolis-provider-sim",
-        root / "build" / "ci-linux-release-fluxgraph-strict" / "anolis-provider-sim",
-        root / "build" / "ci-windows-release-fluxgraph" / "Release" / "anolis-provider-sim.exe",
-        root / "build" / "ci-windows-release-fluxgraph-strict" / "Release" / "anolis-provider-sim.exe",
-    ]
+    override = _env_override_path("ANOLIS_PROVIDER_SIM_EXE", root)
+    if override is not None:
+        return override
+
+    candidates = [root / rel for rel in _FLUXGRAPH_PROVIDER_CANDIDATES]
     for candidate in candidates:
-        if candidate.exists():
+        if candidate.is_file():
             return candidate.resolve()
 
     candidate_text = "\n".join(f"  - {path}" for path in candidates)
@@ -88,14 +98,9 @@ def resolve_fluxgraph_server(root: Path | None = None) -> Path:
     """Resolve FluxGraph server executable path."""
     root = root or repo_root()
 
-    env_path = os.environ.get("FLUXGRAPH_SERVER_EXE")
-    if env_path:
-        candidate = Path(env_path)
-        if not candidate.is_absolute():
-            candidate = root / candidate
-        if candidate.exists():
-            return candidate.resolve()
-        raise FileNotFoundError(f"FLUXGRAPH_SERVER_EXE points to missing file: {candidate}")
+    override = _env_override_path("FLUXGRAPH_SERVER_EXE", root)
+    if override is not None:
+        return override
 
     fluxgraph_root_env = os.environ.get("FLUXGRAPH_DIR")
     if fluxgraph_root_env:
@@ -127,25 +132,22 @@ def resolve_fluxgraph_server(root: Path | None = None) -> Path:
         "build/server",
     ]
 
-    candidates: list[Path] = []
-    seen: set[Path] = set()
-    for build_dir in build_dirs:
-        for name in names:
-            candidate = fluxgraph_root / build_dir / name
-            if candidate not in seen:
-                candidates.append(candidate)
-                seen.add(candidate)
+    candidates = [fluxgraph_root / build_dir / name for build_dir in build_dirs for name in names]
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate.resolve()
 
-    # Final fallback for future preset/output layout changes.
+    # Final fallback for future preset/output layout changes. The recursive
+    # glob walks the whole server build tree, so only pay for it on a miss.
+    seen = set(candidates)
     for pattern in ("build*/server/**/fluxgraph-server.exe", "build*/server/**/fluxgraph-server"):
         for candidate in sorted(fluxgraph_root.glob(pattern)):
-            if candidate not in seen:
-                candidates.append(candidate)
-                seen.add(candidate)
-
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate.resolve()
+            if candidate in seen:
+                continue
+            if candidate.is_file():
+                return candidate.resolve()
+            candidates.append(candidate)
+            seen.add(candidate)
 
     candidate_text = "\n".join(f"  - {path}" for path in candidates)
     raise FileNotFoundError(
@@ -165,6 +167,15 @@ def resolve_config_path(path: str | Path, root: Path | None = None) -> Path:
     return candidate.resolve()
 
 
+def _has_listener(port: int, timeout: float = 0.05) -> bool:
+    """Return True if something accepts connections on localhost:port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        # A local listener accepts immediately; the timeout only bounds
+        # platforms (Windows) that retry refused connections for seconds.
+        probe.settimeout(timeout)
+        return probe.connect_ex(("127.0.0.1", port)) == 0
+
+
 def find_free_port(start: int = 50051, max_tries: int = 10) -> int:
     """Find a free localhost TCP port in a bounded range."""
     for port in range(start, start + max_tries):
@@ -172,7 +183,10 @@ def find_free_port(start: int = 50051, max_tries: int = 10) -> int:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
                 sock.bind(("127.0.0.1", port))
-                return port
             except OSError:
                 continue
+        # SO_REUSEADDR lets bind() succeed over an active listener on some
+        # platforms (notably Windows), so confirm nobody is serving the port.
+        if not _has_listener(port):
+            return port
     raise RuntimeError(f"No free ports in range [{start}, {start + max_tries - 1}]")
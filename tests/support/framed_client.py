@@ -2,13 +2,85 @@
 
 from __future__ import annotations
 
+import collections
+import io
+import os
+import selectors
 import struct
 import subprocess
 from pathlib import Path
 from types import ModuleType
-from typing import Any
-
-from .process import LineCapture, terminate_process
+from typing import Any, Callable, Hashable, Sequence, cast
+
+from .process import LineCapture, terminate_process, wait_process
+
+# Receive chunk size; typical ADPP responses fit in a single pipe read.
+_RX_CHUNK_SIZE = 64 * 1024
+# uint32 little-endian frame length prefix, compiled once.
+_FRAME_HEADER = struct.Struct("<I")
+# Requested pipe capacity (Linux only) so pipelined batches do not stall on a full pipe.
+_PIPE_SIZE = 1 << 20
+# Cap on cached request templates; varied call arguments must not grow it unbounded.
+_MAX_TEMPLATES = 512
+# Plain scalar -> (ValueType name, Value field), shared by call_function arguments and
+# the make_*_value helpers. These types can also key a template (type is part of the key: True == 1).
+_SCALAR_VALUE_FIELDS: dict[type, tuple[str, str]] = {
+    str: ("VALUE_TYPE_STRING", "string_value"),
+    bool: ("VALUE_TYPE_BOOL", "bool_value"),
+    int: ("VALUE_TYPE_INT64", "int64_value"),
+    float: ("VALUE_TYPE_DOUBLE", "double_value"),
+}
+# Exact IEEE-754 encoding used to key float call arguments.
+_DOUBLE_BITS = struct.Struct("<d")
+# Upper bound on waiting for response bytes before declaring the provider hung.
+_RESPONSE_TIMEOUT_SEC = 30.0
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _arg_key(value: Any) -> Any:
+    # Floats key by bit pattern: -0.0 == 0.0 (and nan != nan) would otherwise
+    # reuse the wrong template or never hit one.
+    if type(value) is float:
+        return _DOUBLE_BITS.pack(value)
+    return value
+
+
+def _grow_pipe(fd: int) -> None:
+    """Best-effort pipe enlargement; silently a no-op where unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_pipe_size is None:
+        return
+    try:
+        fcntl.fcntl(fd, set_pipe_size, _PIPE_SIZE)
+    except OSError:
+        pass  # capped by /proc/sys/fs/pipe-max-size for unprivileged users
+
+
+def _set_scalar(protocol: ModuleType, target: Any, scalar_type: type, value: Any) -> None:
+    type_name, field = _SCALAR_VALUE_FIELDS[scalar_type]
+    target.type = protocol.ValueType.Value(type_name)
+    setattr(target, field, value)
+
+
+def _assign_value(protocol: ModuleType, target: Any, value: Any) -> None:
+    # Walking the MRO resolves bool before its int base class.
+    for cls in type(value).__mro__:
+        if cls in _SCALAR_VALUE_FIELDS:
+            _set_scalar(protocol, target, cls, value)
+            return
+    target.CopyFrom(value)
 
 
 class AdppClient:
@@ -21,11 +93,13 @@ class AdppClient:
         config_path: Path,
         *,
         sim_server: str | None = None,
+        response_timeout: float = _RESPONSE_TIMEOUT_SEC,
     ):
         self.protocol = protocol
         self.exe_path = exe_path
         self.config_path = config_path
         self._next_request_id = 1
+        self.response_timeout = response_timeout
 
         cmd = [str(exe_path), "--config", str(config_path)]
         if sim_server:
@@ -39,9 +113,38 @@ class AdppClient:
             bufsize=0,
         )
 
-        self.stderr_capture = LineCapture(self.process.stderr)
+        # bufsize=0 applies to every pipe; give the line-oriented stderr capture
+        # its own buffer so readline() does not fall back to 1-byte raw reads.
+        stderr = self.process.stderr
+        self.stderr_capture = LineCapture(io.BufferedReader(cast(io.RawIOBase, stderr)) if stderr else None)
         self.stderr_capture.start()
 
+        # Raw (bufsize=0) pipes: frames go straight to the fd and responses are
+        # demuxed from one persistent receive buffer.
+        self._stdin_fd = self.process.stdin.fileno() if self.process.stdin is not None else -1
+        self._stdout_raw = cast(io.RawIOBase | None, self.process.stdout)
+        if self._stdin_fd >= 0:
+            _grow_pipe(self._stdin_fd)
+        if self.process.stdout is not None:
+            _grow_pipe(self.process.stdout.fileno())
+        self._rx_chunk = bytearray(_RX_CHUNK_SIZE)
+        self._rx_buffer = bytearray()
+        self._parse_accepts_view = True
+        # Windows cannot select() on pipes; there reads stay plain blocking calls.
+        self._rx_selector: selectors.BaseSelector | None = None
+        if os.name != "nt" and self.process.stdout is not None:
+            self._rx_selector = selectors.DefaultSelector()
+            self._rx_selector.register(self.process.stdout, selectors.EVENT_READ)
+
+        # Fixed-shape requests are serialized once without request_id; each send
+        # prepends the encoded request_id field (protobuf merges concatenations).
+        self._request_id_key: bytes = protocol.Request(request_id=1).SerializeToString()[:-1]
+        self._templates: dict[Hashable, bytes] = {}
+        self._templates_enabled = self._probe_request_id_encoding()
+        self._scratch_request = protocol.Request()
+        # request_ids written by submit_*() whose responses are still unread.
+        self._pending: collections.deque[int] = collections.deque()
+
     def is_running(self) -> bool:
         return self.process.poll() is None
 
@@ -50,47 +153,156 @@ class AdppClient:
         self._next_request_id += 1
         return request_id
 
-    def _read_exact(self, length: int) -> bytes:
-        stream = self.process.stdout
+    def _write_frames(self, payloads: Sequence[bytes]) -> None:
+        if self._stdin_fd < 0:
+            raise RuntimeError("Provider stdin stream unavailable")
+
+        buffers: list[bytes] = []
+        for payload in payloads:
+            buffers.append(_FRAME_HEADER.pack(len(payload)))
+            buffers.append(payload)
+
+        sent = 0
+        if hasattr(os, "writev"):
+            # Gathered write: every header + payload in one syscall, no concat copy.
+            sent = os.writev(self._stdin_fd, buffers)
+
+        # Finish short (or non-writev) writes buffer by buffer; header and
+        # payload are never concatenated, so no frame-sized copy is made.
+        for buf in buffers:
+            if sent >= len(buf):
+                sent -= len(buf)
+                continue
+            view = memoryview(buf)[sent:]
+            sent = 0
+            while view:
+                view = view[os.write(self._stdin_fd, view) :]
+
+    def _fill_rx_buffer(self) -> None:
+        stream = self._stdout_raw
         if stream is None:
             raise RuntimeError("Provider stdout stream unavailable")
 
-        out = bytearray()
-        while len(out) < length:
-            chunk = stream.read(length - len(out))
-            if not chunk:
-                raise RuntimeError(
-                    f"Provider stream closed while reading {length} bytes; got {len(out)} bytes\n"
-                    f"{self.output_tail(100)}"
-                )
-            out.extend(chunk)
-        return bytes(out)
+        if self._rx_selector is not None and not self._rx_selector.select(self.response_timeout):
+            state = "running" if self.is_running() else f"exited with code={self.process.poll()}"
+            raise RuntimeError(
+                f"Timed out after {self.response_timeout:g}s waiting for provider response (provider {state}); "
+                f"got {len(self._rx_buffer)} buffered bytes\n{self.output_tail(100)}"
+            )
+        count = stream.readinto(self._rx_chunk)
+        if not count:
+            raise RuntimeError(
+                f"Provider stream closed while reading frame (code={self.process.poll()}); "
+                f"got {len(self._rx_buffer)} buffered bytes\n{self.output_tail(100)}"
+            )
+        self._rx_buffer += memoryview(self._rx_chunk)[:count]
+
+    def _buffer_frame(self) -> int:
+        """Ensure one complete frame is buffered; return the offset just past it."""
+        while True:
+            buffered = len(self._rx_buffer)
+            if buffered >= _FRAME_HEADER.size:
+                (length,) = _FRAME_HEADER.unpack_from(self._rx_buffer)
+                end: int = _FRAME_HEADER.size + length
+                if buffered >= end:
+                    return end
+            self._fill_rx_buffer()
+
+    def _read_response(self, into: Any | None = None) -> Any:
+        # ParseFromString clears first, so a caller-owned scratch message can be reused.
+        response = self.protocol.Response() if into is None else into
+        end = self._buffer_frame()
+        # Parse straight out of the receive buffer; the view must be released
+        # before the consumed prefix is deleted.
+        with memoryview(self._rx_buffer) as view, view[_FRAME_HEADER.size : end] as body:
+            if self._parse_accepts_view:
+                try:
+                    response.ParseFromString(body)
+                except TypeError:
+                    # Older backends only take bytes; remember and copy from now on.
+                    self._parse_accepts_view = False
+            if not self._parse_accepts_view:
+                response.ParseFromString(body.tobytes())
+        del self._rx_buffer[:end]
+        return response
 
-    def send_request(self, request: Any) -> Any:
+    def _ensure_idle(self) -> None:
+        """Blocking RPCs read the next frame, so nothing submitted may be outstanding."""
+        if self._pending:
+            raise RuntimeError(f"{len(self._pending)} submitted request(s) not collected; call collect() first")
+        self._ensure_running()
+
+    def _ensure_running(self) -> None:
         if not self.is_running():
             raise RuntimeError(
                 f"Provider process exited before request send (code={self.process.poll()})\n{self.output_tail(100)}"
             )
 
-        payload = request.SerializeToString()
-        frame = struct.pack("<I", len(payload)) + payload
-
-        stdin = self.process.stdin
-        if stdin is None:
-            raise RuntimeError("Provider stdin stream unavailable")
+    def send_request(self, request: Any, *, into: Any | None = None) -> Any:
+        return self._send_payload(request.SerializeToString(), request.request_id, into=into)
+
+    def _probe_request_id_encoding(self) -> bool:
+        probe = self.protocol.Request()
+        try:
+            probe.ParseFromString(self._request_id_key + _encode_varint(300))
+        except Exception:
+            return False
+        return bool(probe.request_id == 300)
+
+    def _templated_payload(self, key: Hashable, fill: Callable[[Any], None]) -> bytes:
+        if not self._templates_enabled:
+            request = self.protocol.Request(request_id=self._request_id())
+            fill(request)
+            return bytes(request.SerializeToString())
+
+        body = self._templates.get(key)
+        if body is None:
+            template = self.protocol.Request()
+            fill(template)
+            body = template.SerializeToString()
+            if len(self._templates) < _MAX_TEMPLATES:
+                self._templates[key] = body
+        return self._request_id_key + _encode_varint(self._request_id()) + body
+
+    def _send_payload(self, payload: bytes, request_id: int, *, into: Any | None = None) -> Any:
+        self._ensure_idle()
+        self._write_frames((payload,))
+        response = self._read_response(into)
+        # A stale reply (e.g. left over from a request whose caller raised) would
+        # otherwise be handed to this caller and shift every later response.
+        if response.request_id != request_id:
+            raise RuntimeError(f"Response out of order: expected request_id={request_id}, got {response.request_id}")
+        return response
 
-        stdin.write(frame)
-        stdin.flush()
+    def send_batch(self, requests: Sequence[Any]) -> list[Any]:
+        """Pipeline requests: write all frames at once, then read responses in order.
+
+        The provider serves frames sequentially, so this is equivalent to issuing
+        the requests one by one minus the per-request round trips. Keep batches
+        small; no responses are drained until every frame has been written.
+        """
+        if not requests:
+            return []
+        return self._send_pipelined(
+            [request.SerializeToString() for request in requests],
+            [request.request_id for request in requests],
+        )
 
-        header = self._read_exact(4)
-        (resp_len,) = struct.unpack("<I", header)
-        body = self._read_exact(resp_len)
+    def _send_pipelined(self, payloads: Sequence[bytes], request_ids: Sequence[int]) -> list[Any]:
+        self._ensure_idle()
+        self._write_frames(payloads)
 
-        response = self.protocol.Response()
-        response.ParseFromString(body)
-        return response
+        responses: list[Any] = []
+        for expected_id in request_ids:
+            response = self._read_response()
+            if response.request_id != expected_id:
+                raise RuntimeError(
+                    f"Pipelined response out of order: expected request_id={expected_id}, got {response.request_id}"
+                )
+            responses.append(response)
+        return responses
 
-    def hello(
+    def build_hello(
         self,
         *,
         client_name: str = "provider-sim-test",
@@ -101,31 +313,47 @@ class AdppClient:
         request.hello.protocol_version = protocol_version
         request.hello.client_name = client_name
         request.hello.client_version = client_version
-        return self.send_request(request)
+        return request
 
-    def wait_ready(self, max_wait_ms_hint: int = 5000) -> Any:
+    def build_wait_ready(self, max_wait_ms_hint: int = 5000) -> Any:
         request = self.protocol.Request(request_id=self._request_id())
         request.wait_ready.max_wait_ms_hint = max_wait_ms_hint
-        return self.send_request(request)
+        return request
 
-    def list_devices(self, include_health: bool = False) -> Any:
-        request = self.protocol.Request(request_id=self._request_id())
-        request.list_devices.include_health = include_health
-        return self.send_request(request)
+    @staticmethod
+    def _fill_list_devices(request: Any, include_health: bool) -> None:
+        if include_health:
+            request.list_devices.include_health = True
+        else:
+            # Only materialize the oneof arm; assigning the proto3 default is a no-op write.
+            request.list_devices.SetInParent()
 
-    def describe_device(self, device_id: str) -> Any:
+    def build_list_devices(self, include_health: bool = False) -> Any:
         request = self.protocol.Request(request_id=self._request_id())
+        self._fill_list_devices(request, include_health)
+        return request
+
+    @staticmethod
+    def _fill_describe_device(request: Any, device_id: str) -> None:
         request.describe_device.device_id = device_id
-        return self.send_request(request)
 
-    def read_signals(self, device_id: str, signal_ids: list[str] | None = None) -> Any:
+    def build_describe_device(self, device_id: str) -> Any:
         request = self.protocol.Request(request_id=self._request_id())
+        self._fill_describe_device(request, device_id)
+        return request
+
+    @staticmethod
+    def _fill_read_signals(request: Any, device_id: str, signal_ids: Sequence[str] | None) -> None:
         request.read_signals.device_id = device_id
         if signal_ids:
             request.read_signals.signal_ids.extend(signal_ids)
-        return self.send_request(request)
 
-    def call_function(
+    def build_read_signals(self, device_id: str, signal_ids: list[str] | None = None) -> Any:
+        request = self.protocol.Request(request_id=self._request_id())
+        self._fill_read_signals(request, device_id, signal_ids)
+        return request
+
+    def build_call_function(
         self,
         device_id: str,
         function_id: int = 0,
@@ -133,21 +361,182 @@ class AdppClient:
         *,
         function_name: str | None = None,
     ) -> Any:
+        """Build a CallFunction request.
+
+        ``args`` values may be ``Value`` messages or plain str/bool/int/float
+        scalars; scalars are written straight into the request's map entry.
+        """
         request = self.protocol.Request(request_id=self._request_id())
+        self._fill_call_function(request, device_id, function_id, args, function_name)
+        return request
+
+    def _fill_call_function(
+        self,
+        request: Any,
+        device_id: str,
+        function_id: int,
+        args: dict[str, Any] | None,
+        function_name: str | None,
+    ) -> None:
         request.call.device_id = device_id
         request.call.function_id = function_id
         if function_name:
             request.call.function_name = function_name
         if args:
             for key, value in args.items():
-                request.call.args[key].CopyFrom(value)
-        return self.send_request(request)
+                _assign_value(self.protocol, request.call.args[key], value)
 
-    def get_health(self) -> Any:
-        request = self.protocol.Request(request_id=self._request_id())
+    @staticmethod
+    def _fill_get_health(request: Any) -> None:
         request.get_health.SetInParent()
+
+    def build_get_health(self) -> Any:
+        request = self.protocol.Request(request_id=self._request_id())
+        self._fill_get_health(request)
+        return request
+
+    def hello(
+        self,
+        *,
+        client_name: str = "provider-sim-test",
+        client_version: str = "0.0.1",
+        protocol_version: str = "v1",
+    ) -> Any:
+        return self.send_request(
+            self.build_hello(
+                client_name=client_name,
+                client_version=client_version,
+                protocol_version=protocol_version,
+            )
+        )
+
+    def wait_ready(self, max_wait_ms_hint: int = 5000) -> Any:
+        return self.send_request(self.build_wait_ready(max_wait_ms_hint))
+
+    def _list_devices_payload(self, include_health: bool) -> bytes:
+        return self._templated_payload(
+            ("list_devices", include_health),
+            lambda request: self._fill_list_devices(request, include_health),
+        )
+
+    def list_devices(self, include_health: bool = False) -> Any:
+        request_id = self._next_request_id
+        return self._send_payload(self._list_devices_payload(include_health), request_id)
+
+    def _describe_device_payload(self, device_id: str) -> bytes:
+        return self._templated_payload(
+            ("describe_device", device_id),
+            lambda request: self._fill_describe_device(request, device_id),
+        )
+
+    def describe_device(self, device_id: str) -> Any:
+        request_id = self._next_request_id
+        return self._send_payload(self._describe_device_payload(device_id), request_id)
+
+    def _read_signals_payload(self, device_id: str, signal_ids: Sequence[str] | None) -> bytes:
+        ids = tuple(signal_ids or ())
+        return self._templated_payload(
+            ("read_signals", device_id, ids),
+            lambda request: self._fill_read_signals(request, device_id, ids),
+        )
+
+    def read_signals(self, device_id: str, signal_ids: list[str] | None = None, *, into: Any | None = None) -> Any:
+        """Read signals; pass a reusable Response as ``into`` to skip per-call allocation."""
+        request_id = self._next_request_id
+        return self._send_payload(self._read_signals_payload(device_id, signal_ids), request_id, into=into)
+
+    def submit_read_signals(self, device_id: str, signal_ids: list[str] | None = None) -> int:
+        """Write a ReadSignals frame without waiting for the reply; return its request_id.
+
+        Lets a caller overlap this provider's round trip with work on another
+        client. Every submitted request must be collect()ed, in order, before
+        the next blocking RPC on this client.
+        """
+        request_id = self._next_request_id
+        return self._submit(self._read_signals_payload(device_id, signal_ids), request_id)
+
+    def submit_request(self, request: Any) -> int:
+        """Write a prebuilt request without waiting; see submit_read_signals()."""
+        return self._submit(request.SerializeToString(), request.request_id)
+
+    def _submit(self, payload: bytes, request_id: int) -> int:
+        self._ensure_running()
+        self._write_frames((payload,))
+        self._pending.append(request_id)
+        return request_id
+
+    def collect(self, *, into: Any | None = None) -> Any:
+        """Read the response to the oldest submitted request."""
+        if not self._pending:
+            raise RuntimeError("collect() called with no submitted requests")
+        expected_id = self._pending.popleft()
+        response = self._read_response(into)
+        if response.request_id != expected_id:
+            raise RuntimeError(
+                f"Submitted response out of order: expected request_id={expected_id}, got {response.request_id}"
+            )
+        return response
+
+    def read_signals_batch(self, reads: Sequence[tuple[str, list[str] | None]]) -> list[Any]:
+        """Pipeline several ReadSignals as (device_id, signal_ids) pairs; responses keep input order."""
+        if not reads:
+            return []
+        first_id = self._next_request_id
+        payloads = [self._read_signals_payload(device_id, signal_ids) for device_id, signal_ids in reads]
+        return self._send_pipelined(payloads, range(first_id, first_id + len(payloads)))
+
+    def _call_function_payload(
+        self,
+        device_id: str,
+        function_id: int,
+        args: dict[str, Any] | None,
+        function_name: str | None,
+    ) -> bytes | None:
+        """Templated CallFunction payload, or None when an argument is not a plain scalar."""
+        # Calls whose arguments are all plain scalars are hashable, so repeated
+        # identical calls (set_mode "closed", clear_faults, ...) reuse a template.
+        arg_items = tuple(args.items()) if args else ()
+        if not all(type(value) in _SCALAR_VALUE_FIELDS for _, value in arg_items):
+            return None
+        key = (
+            "call",
+            device_id,
+            function_id,
+            function_name,
+            tuple((name, type(value), _arg_key(value)) for name, value in arg_items),
+        )
+        return self._templated_payload(
+            key,
+            lambda request: self._fill_call_function(request, device_id, function_id, args, function_name),
+        )
+
+    def call_function(
+        self,
+        device_id: str,
+        function_id: int = 0,
+        args: dict[str, Any] | None = None,
+        *,
+        function_name: str | None = None,
+    ) -> Any:
+        request_id = self._next_request_id
+        payload = self._call_function_payload(device_id, function_id, args, function_name)
+        if payload is not None:
+            return self._send_payload(payload, request_id)
+
+        # Value-message arguments are not hashable; reuse one scratch Request instead.
+        request = self._scratch_request
+        request.Clear()
+        request.request_id = self._request_id()
+        self._fill_call_function(request, device_id, function_id, args, function_name)
         return self.send_request(request)
 
+    def _get_health_payload(self) -> bytes:
+        return self._templated_payload(("get_health",), self._fill_get_health)
+
+    def get_health(self) -> Any:
+        request_id = self._next_request_id
+        return self._send_payload(self._get_health_payload(), request_id)
+
     def output_tail(self, lines: int = 80) -> str:
         return self.stderr_capture.tail(lines)
 
@@ -161,36 +550,33 @@ class AdppClient:
 
         if self.process.poll() is None:
             try:
-                self.process.wait(timeout=timeout)
+                wait_process(self.process, timeout=timeout)
             except subprocess.TimeoutExpired:
                 terminate_process(self.process, timeout=timeout)
 
+        if self._rx_selector is not None:
+            self._rx_selector.close()
+            self._rx_selector = None
         self.stderr_capture.stop()
 
 
-def make_string_value(protocol: ModuleType, value: str) -> Any:
+def _make_value(protocol: ModuleType, scalar_type: type, value: Any) -> Any:
     out = protocol.Value()
-    out.type = protocol.ValueType.VALUE_TYPE_STRING
-    out.string_value = value
+    _set_scalar(protocol, out, scalar_type, value)
     return out
 
 
+def make_string_value(protocol: ModuleType, value: str) -> Any:
+    return _make_value(protocol, str, value)
+
+
 def make_double_value(protocol: ModuleType, value: float) -> Any:
-    out = protocol.Value()
-    out.type = protocol.ValueType.VALUE_TYPE_DOUBLE
-    out.double_value = value
-    return out
+    return _make_value(protocol, float, value)
 
 
 def make_int64_value(protocol: ModuleType, value: int) -> Any:
-    out = protocol.Value()
-    out.type = protocol.ValueType.VALUE_TYPE_INT64
-    out.int64_value = value
-    return out
+    return _make_value(protocol, int, value)
 
 
 def make_bool_value(protocol: ModuleType, value: bool) -> Any:
-    out = protocol.Value()
-    out.type = protocol.ValueType.VALUE_TYPE_BOOL
-    out.bool_value = value
-    return out
+    return _make_value(protocol, bool, value)
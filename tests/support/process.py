@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+import collections
+import itertools
+import os
+import select
 import subprocess
+import sys
 import threading
 import time
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
 
 
 class LineCapture:
-    """Capture text stream lines in a background thread."""
+    """Capture text stream lines in a background thread.
 
-    def __init__(self, stream: Any | None):
+    The stream is drained continuously so a chatty child never blocks on a full
+    pipe; only the newest ``max_lines`` lines are retained for diagnostics.
+    """
+
+    def __init__(self, stream: Any | None, max_lines: int = 2000):
         self._stream = stream
-        self._lines: list[str] = []
+        self._lines: collections.deque[str] = collections.deque(maxlen=max_lines)
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
@@ -46,8 +55,8 @@ class LineCapture:
 
     def tail(self, lines: int = 80) -> str:
         with self._lock:
-            slice_lines = self._lines[-lines:] if lines > 0 else self._lines
-            return "\n".join(slice_lines)
+            start = max(len(self._lines) - lines, 0) if lines > 0 else 0
+            return "\n".join(itertools.islice(self._lines, start, None))
 
     def stop(self, timeout: float = 1.0) -> None:
         self._stop_event.set()
@@ -55,6 +64,60 @@ class LineCapture:
             self._thread.join(timeout=timeout)
 
 
+def _wait_exit_event(pid: int, timeout: float) -> bool | None:
+    """Block until pid exits via pidfd (Linux) or kqueue (BSD/macOS).
+
+    Returns whether the process exited within timeout, or None when no exit
+    notification is available and the caller must fall back to polling.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:  # kernel without pidfd support
+            return None
+        try:
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+            return bool(poller.poll(max(0, int(timeout * 1000))))
+        finally:
+            os.close(fd)
+    elif sys.platform == "darwin" or sys.platform.startswith("freebsd"):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            return bool(kq.control([event], 1, max(0.0, timeout)))
+        except OSError:  # already exited (zombie) or not watchable
+            return None
+        finally:
+            kq.close()
+    else:
+        return None
+
+
+def wait_process(proc: subprocess.Popen, timeout: float) -> int:
+    """Wait for proc to exit, waking on the exit itself where the OS allows.
+
+    Popen.wait(timeout=...) polls waitpid with sleeps of up to 50 ms; this
+    returns as soon as the child exits. Raises subprocess.TimeoutExpired like
+    Popen.wait.
+    """
+    returncode = proc.poll()
+    if returncode is not None:
+        return returncode
+
+    exited = _wait_exit_event(proc.pid, timeout)
+    if exited is None:
+        return proc.wait(timeout=timeout)
+    if not exited:
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return proc.wait()
+
+
 def terminate_process(proc: subprocess.Popen, timeout: float = 5.0) -> None:
     """Terminate process with graceful-then-force fallback."""
     if proc.poll() is not None:
@@ -62,18 +125,29 @@ def terminate_process(proc: subprocess.Popen, timeout: float = 5.0) -> None:
 
     proc.terminate()
     try:
-        proc.wait(timeout=timeout)
+        wait_process(proc, timeout=timeout)
         return
     except subprocess.TimeoutExpired:
         pass
 
     proc.kill()
     try:
-        proc.wait(timeout=2.0)
+        wait_process(proc, timeout=2.0)
     except subprocess.TimeoutExpired:
         pass
 
 
+def wait_until(predicate: Callable[[], bool], timeout: float, interval: float = 0.05) -> bool:
+    """Poll predicate until it returns True or timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while True:
+        if predicate():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
 class ManagedTextProcess:
     """Text-process wrapper with stdout/stderr tail capture."""
 
@@ -134,17 +208,21 @@ class ManagedTextProcess:
     ) -> bool:
         import socket
 
-        deadline = time.time() + timeout
-        while time.time() < deadline:
+        # Probe quickly at first (servers usually listen within milliseconds),
+        # backing off to ``interval`` between attempts.
+        delay = min(0.01, interval)
+        deadline = time.monotonic() + timeout
+        while True:
             self.assert_running(f"wait_for_port {host}:{port}")
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(0.2)
-                try:
-                    sock.connect((host, port))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                with socket.create_connection((host, port), timeout=min(0.2, remaining)):
                     return True
-                except OSError:
-                    time.sleep(interval)
-        return False
+            except OSError:
+                time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                delay = min(delay * 2, interval)
 
     def close(self, timeout: float = 5.0) -> None:
         terminate_process(self.process, timeout=timeout)
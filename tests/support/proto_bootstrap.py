@@ -2,10 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
+import os
+import sys
 from types import ModuleType
 
+# Prefer the native upb backend (protobuf>=4.21); the pure-Python runtime is an
+# order of magnitude slower for the per-frame serialize/parse work in tests.
+_PREFERRED_PROTOBUF_BACKEND = "upb"
 
+
+def protobuf_backend() -> str:
+    """Return the active protobuf runtime implementation (upb, cpp, or python)."""
+    from google.protobuf.internal import api_implementation
+
+    return str(api_implementation.Type())
+
+
+@functools.cache
 def load_protocol_module() -> ModuleType:
-    """Load protocol_pb2 module from the installed anolis-protocol package."""
-    return importlib.import_module("protocol_pb2")
+    """Load protocol_pb2 module from the installed anolis-protocol package.
+
+    The result is cached, so helpers may call this freely; the backend check
+    (and its warning) runs once per process.
+    """
+    os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", _PREFERRED_PROTOBUF_BACKEND)
+    module = importlib.import_module("protocol_pb2")
+
+    backend = protobuf_backend()
+    if backend not in ("upb", "cpp"):
+        print(
+            f"WARNING: protobuf is using the '{backend}' runtime; install protobuf>=4.21 for the native upb backend",
+            file=sys.stderr,
+        )
+    return module
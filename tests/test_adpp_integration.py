@@ -13,44 +13,41 @@ from __future__ import annotations
 
 import argparse
 import sys
-import time
 
 from support.assertions import (
     assert_ok,
     list_devices_entries,
     require_signal,
+    require_signals,
     status_text,
 )
 from support.env import repo_root, resolve_config_path, resolve_provider_executable
-from support.framed_client import (
-    AdppClient,
-    make_bool_value,
-    make_double_value,
-    make_int64_value,
-    make_string_value,
-)
+from support.framed_client import AdppClient
+from support.process import wait_until
 from support.proto_bootstrap import load_protocol_module
 
+CONVERGENCE_RISE_C = 1.0
+MOTOR_MIN_SPEED_RPM = 1000.0
+
+EXPECTED_DEVICES = frozenset({"tempctl0", "motorctl0", "relayio0", "analogsensor0", "chaos_control"})
+EXPECTED_TEMPCTL_SIGNALS = frozenset(
+    {"tc1_temp", "tc2_temp", "relay1_state", "relay2_state", "control_mode", "setpoint"}
+)
+EXPECTED_TEMPCTL_FUNCTIONS = frozenset({1, 2, 3})  # set_mode, set_setpoint, set_relay
+
 
 def test_list_devices(client: AdppClient) -> bool:
     """Verify ListDevices returns expected default config devices."""
     print("\n=== Test 1: ListDevices ===")
-    resp = client.list_devices(include_health=False)
+    resp = client.list_devices()
     assert_ok(resp, "list_devices")
 
     devices = list_devices_entries(resp)
     assert len(devices) == 5, f"Expected 5 devices, got {len(devices)}"
 
     device_ids = [entry.device_id for entry in devices]
-    expected = [
-        "tempctl0",
-        "motorctl0",
-        "relayio0",
-        "analogsensor0",
-        "chaos_control",
-    ]
-    for device_id in expected:
-        assert device_id in device_ids, f"Missing device: {device_id}"
+    missing = EXPECTED_DEVICES.difference(device_ids)
+    assert not missing, f"Missing devices: {sorted(missing)}"
 
     print(f"OK: Found {len(devices)} devices: {device_ids}")
     return True
@@ -90,16 +87,10 @@ def test_describe_tempctl(client: AdppClient) -> bool:
     signal_ids = [entry.signal_id for entry in caps.signals]
     function_ids = [entry.function_id for entry in caps.functions]
 
-    assert "tc1_temp" in signal_ids
-    assert "tc2_temp" in signal_ids
-    assert "relay1_state" in signal_ids
-    assert "relay2_state" in signal_ids
-    assert "control_mode" in signal_ids
-    assert "setpoint" in signal_ids
-
-    assert 1 in function_ids  # set_mode
-    assert 2 in function_ids  # set_setpoint
-    assert 3 in function_ids  # set_relay
+    missing_signals = EXPECTED_TEMPCTL_SIGNALS.difference(signal_ids)
+    assert not missing_signals, f"Missing tempctl0 signals: {sorted(missing_signals)}"
+    missing_functions = EXPECTED_TEMPCTL_FUNCTIONS.difference(function_ids)
+    assert not missing_functions, f"Missing tempctl0 function ids: {sorted(missing_functions)}"
 
     print(f"  Signals ({len(signal_ids)}): {signal_ids}")
     print(f"  Functions ({len(function_ids)}): {function_ids}")
@@ -114,28 +105,34 @@ def test_temp_convergence(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "closed")},
+        {"mode": "closed"},
     )
     assert_ok(resp, "set_mode closed")
 
     resp = client.call_function(
         "tempctl0",
         2,
-        {"value": make_double_value(protocol, 80.0)},
+        {"value": 80.0},
     )
     assert_ok(resp, "set_setpoint 80")
 
     temps: list[tuple[float, float]] = []
-    for idx in range(10):
-        resp = client.read_signals("tempctl0", ["tc1_temp", "tc2_temp"])
-        assert_ok(resp, f"read_signals temperature sample {idx + 1}")
-
-        tc1 = float(require_signal(resp, "tc1_temp").value.double_value)
-        tc2 = float(require_signal(resp, "tc2_temp").value.double_value)
-        temps.append((tc1, tc2))
 
-        print(f"  Read {idx + 1}: TC1={tc1:.1f} C, TC2={tc2:.1f} C")
-        time.sleep(1.5)
+    def _both_rose() -> bool:
+        resp = client.read_signals("tempctl0", ["tc1_temp", "tc2_temp"])
+        assert_ok(resp, f"read_signals temperature sample {len(temps) + 1}")
+        tc1_entry, tc2_entry = require_signals(resp, "tc1_temp", "tc2_temp")
+        temps.append((float(tc1_entry.value.double_value), float(tc2_entry.value.double_value)))
+        first, last = temps[0], temps[-1]
+        return last[0] >= first[0] + CONVERGENCE_RISE_C and last[1] >= first[1] + CONVERGENCE_RISE_C
+
+    # Poll until both thermocouples have clearly risen; the timeout matches the
+    # previous fixed 10 x 1.5 s sampling window.
+    wait_until(_both_rose, timeout=15.0, interval=0.05)
+    print(
+        f"  {len(temps)} samples: TC1 {temps[0][0]:.1f} -> {temps[-1][0]:.1f} C, "
+        f"TC2 {temps[0][1]:.1f} -> {temps[-1][1]:.1f} C"
+    )
 
     assert temps[-1][0] > temps[0][0], "TC1 temperature did not increase"
     assert temps[-1][1] > temps[0][1], "TC2 temperature did not increase"
@@ -152,24 +149,25 @@ def test_motor_control(client: AdppClient, protocol) -> bool:
         "motorctl0",
         10,
         {
-            "motor_index": make_int64_value(protocol, 1),
-            "duty": make_double_value(protocol, 0.5),
+            "motor_index": 1,
+            "duty": 0.5,
         },
     )
     assert_ok(resp, "set_motor_duty motor1")
 
     speeds: list[float] = []
-    for idx in range(6):
+
+    def _spun_up() -> bool:
         resp = client.read_signals("motorctl0", ["motor1_speed"])
-        assert_ok(resp, f"read motor speed sample {idx + 1}")
-        speed = float(require_signal(resp, "motor1_speed").value.double_value)
-        speeds.append(speed)
+        assert_ok(resp, f"read motor speed sample {len(speeds) + 1}")
+        speeds.append(float(require_signal(resp, "motor1_speed").value.double_value))
+        return speeds[-1] > max(speeds[0], MOTOR_MIN_SPEED_RPM)
 
-        print(f"  Read {idx + 1}: Motor1={speed:.0f} RPM")
-        time.sleep(1.0)
+    wait_until(_spun_up, timeout=6.0, interval=0.05)
+    print(f"  {len(speeds)} samples: Motor1 {speeds[0]:.0f} -> {speeds[-1]:.0f} RPM")
 
     assert speeds[-1] > speeds[0], "Motor speed did not increase"
-    assert speeds[-1] > 1000, f"Motor speed too low: {speeds[-1]:.0f} RPM"
+    assert speeds[-1] > MOTOR_MIN_SPEED_RPM, f"Motor speed too low: {speeds[-1]:.0f} RPM"
 
     print(f"OK: Motor speed ramping up: {speeds[0]:.0f} -> {speeds[-1]:.0f} RPM")
     return True
@@ -182,7 +180,7 @@ def test_relay_control(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "open")},
+        {"mode": "open"},
     )
     assert_ok(resp, "set_mode open")
 
@@ -190,8 +188,8 @@ def test_relay_control(client: AdppClient, protocol) -> bool:
         "tempctl0",
         3,
         {
-            "relay_index": make_int64_value(protocol, 1),
-            "state": make_bool_value(protocol, True),
+            "relay_index": 1,
+            "state": True,
         },
     )
     assert_ok(resp, "set_relay relay1 on")
@@ -200,8 +198,8 @@ def test_relay_control(client: AdppClient, protocol) -> bool:
         "tempctl0",
         3,
         {
-            "relay_index": make_int64_value(protocol, 2),
-            "state": make_bool_value(protocol, False),
+            "relay_index": 2,
+            "state": False,
         },
     )
     assert_ok(resp, "set_relay relay2 off")
@@ -209,8 +207,9 @@ def test_relay_control(client: AdppClient, protocol) -> bool:
     resp = client.read_signals("tempctl0", ["relay1_state", "relay2_state"])
     assert_ok(resp, "read relay states")
 
-    relay1 = require_signal(resp, "relay1_state").value.bool_value
-    relay2 = require_signal(resp, "relay2_state").value.bool_value
+    relay1_entry, relay2_entry = require_signals(resp, "relay1_state", "relay2_state")
+    relay1 = relay1_entry.value.bool_value
+    relay2 = relay2_entry.value.bool_value
 
     assert relay1 is True, "Relay 1 state mismatch"
     assert relay2 is False, "Relay 2 state mismatch"
@@ -226,7 +225,7 @@ def test_precondition_check(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "closed")},
+        {"mode": "closed"},
     )
     assert_ok(resp, "set_mode closed")
 
@@ -234,8 +233,8 @@ def test_precondition_check(client: AdppClient, protocol) -> bool:
         "tempctl0",
         3,
         {
-            "relay_index": make_int64_value(protocol, 1),
-            "state": make_bool_value(protocol, True),
+            "relay_index": 1,
+            "state": True,
         },
     )
 
@@ -251,7 +250,7 @@ def test_call_by_function_name(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         function_name="set_mode",
-        args={"mode": make_string_value(protocol, "open")},
+        args={"mode": "open"},
     )
     assert_ok(resp, "call set_mode by function_name")
 
@@ -8,12 +8,12 @@ import subprocess
 import sys
 import tempfile
 import textwrap
-import time
 from pathlib import Path
 
 from support.assertions import assert_ok, list_devices_entries
 from support.env import repo_root, resolve_provider_executable
 from support.framed_client import AdppClient
+from support.process import wait_until
 from support.proto_bootstrap import load_protocol_module
 
 
@@ -208,7 +208,7 @@ def test_degraded_startup_continue(provider_exe: Path) -> None:
             hello = client.hello(client_name="config-startup-test", client_version="0.0.1")
             assert_ok(hello, "hello degraded startup")
 
-            resp = client.list_devices(include_health=False)
+            resp = client.list_devices()
             assert_ok(resp, "list_devices degraded startup")
             ids = [entry.device_id for entry in list_devices_entries(resp)]
 
@@ -236,9 +236,11 @@ def test_degraded_startup_continue(provider_exe: Path) -> None:
             assert bad_state_name == "STATE_UNREACHABLE", f"Expected bad0 STATE_UNREACHABLE, got {bad_state_name}"
             assert "startup initialization failed" in health_map["bad0"].message
 
-            time.sleep(0.1)
-            stderr_tail = client.output_tail(120)
-            if "degraded init failure: device_id=bad0" not in stderr_tail:
+            # The stderr capture thread may lag the RPC responses; wait for the line
+            # to land instead of sleeping a fixed interval.
+            expected_log = "degraded init failure: device_id=bad0"
+            if not wait_until(lambda: expected_log in client.output_tail(120), timeout=2.0, interval=0.01):
+                stderr_tail = client.output_tail(120)
                 raise AssertionError(f"Expected degraded startup failure log for bad0\nstderr tail:\n{stderr_tail}")
         finally:
             client.close()
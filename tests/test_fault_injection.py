@@ -17,16 +17,16 @@ import argparse
 import sys
 import time
 
-from support.assertions import assert_ok, require_signal, status_text
+from support.assertions import OK_CODE, assert_ok, require_signal, status_text
 from support.env import repo_root, resolve_config_path, resolve_provider_executable
-from support.framed_client import (
-    AdppClient,
-    make_double_value,
-    make_int64_value,
-    make_string_value,
-)
+from support.framed_client import AdppClient
+from support.process import wait_until
 from support.proto_bootstrap import load_protocol_module
 
+# Injected faults in these tests last 300-500 ms; poll for expiry instead of padding.
+FAULT_EXPIRY_TIMEOUT_SEC = 2.0
+FAULT_POLL_SEC = 0.02
+
 
 def test_device_unavailable(client: AdppClient, protocol) -> bool:
     """Validate inject_device_unavailable behavior and auto-recovery."""
@@ -40,27 +40,29 @@ def test_device_unavailable(client: AdppClient, protocol) -> bool:
         "chaos_control",
         1,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "duration_ms": make_int64_value(protocol, 500),
+            "device_id": "tempctl0",
+            "duration_ms": 500,
         },
     )
     assert_ok(resp, "inject_device_unavailable")
 
-    resp = client.describe_device("tempctl0")
-    assert resp.status.code != 1, "Device should return error when unavailable"
-
-    resp = client.read_signals("tempctl0", ["tc1_temp"])
-    assert resp.status.code != 1, "ReadSignals should fail on unavailable device"
-
-    resp = client.call_function(
-        "tempctl0",
-        1,
-        {"mode": make_string_value(protocol, "open")},
+    describe_resp, read_resp, call_resp = client.send_batch(
+        [
+            client.build_describe_device("tempctl0"),
+            client.build_read_signals("tempctl0", ["tc1_temp"]),
+            client.build_call_function("tempctl0", 1, {"mode": "open"}),
+        ]
+    )
+    assert describe_resp.status.code != 1, "Device should return error when unavailable"
+    assert read_resp.status.code != 1, "ReadSignals should fail on unavailable device"
+    assert call_resp.status.code != 1, "CallFunction should fail on unavailable device"
+
+    # Poll for expiry rather than padding past the 500 ms fault window.
+    wait_until(
+        lambda: client.describe_device("tempctl0").status.code == OK_CODE,
+        timeout=FAULT_EXPIRY_TIMEOUT_SEC,
+        interval=FAULT_POLL_SEC,
     )
-    assert resp.status.code != 1, "CallFunction should fail on unavailable device"
-
-    time.sleep(0.6)
-
     resp = client.describe_device("tempctl0")
     assert_ok(resp, "describe tempctl0 after expiration")
     assert len(resp.describe_device.capabilities.signals) == initial_signal_count
@@ -82,9 +84,9 @@ def test_signal_fault(client: AdppClient, protocol) -> bool:
         "chaos_control",
         2,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "signal_id": make_string_value(protocol, "tc1_temp"),
-            "duration_ms": make_int64_value(protocol, 300),
+            "device_id": "tempctl0",
+            "signal_id": "tc1_temp",
+            "duration_ms": 300,
         },
     )
     assert_ok(resp, "inject_signal_fault")
@@ -100,8 +102,11 @@ def test_signal_fault(client: AdppClient, protocol) -> bool:
     quality_name = protocol.SignalValue.Quality.Name(signal.quality)
     print(f"  Faulted value={signal.value.double_value:.1f} C, initial={initial_value:.1f} C, quality={quality_name}")
 
-    time.sleep(0.4)
+    def _quality_recovered() -> bool:
+        resp = client.read_signals("tempctl0", ["tc1_temp"])
+        return bool(resp.status.code == OK_CODE and require_signal(resp, "tc1_temp").quality != expected_fault)
 
+    wait_until(_quality_recovered, timeout=FAULT_EXPIRY_TIMEOUT_SEC, interval=FAULT_POLL_SEC)
     resp = client.read_signals("tempctl0", ["tc1_temp"])
     assert_ok(resp, "read recovered tc1_temp")
     recovered = require_signal(resp, "tc1_temp")
@@ -115,33 +120,33 @@ def test_call_latency(client: AdppClient, protocol) -> bool:
     """Validate injected call latency and clear_faults reset."""
     print("\n=== Test: Call Latency Injection ===")
 
-    start = time.time()
+    start = time.perf_counter()
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "open")},
+        {"mode": "open"},
     )
     assert_ok(resp, "baseline set_mode")
-    baseline_ms = (time.time() - start) * 1000
+    baseline_ms = (time.perf_counter() - start) * 1000
 
     resp = client.call_function(
         "chaos_control",
         3,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "latency_ms": make_int64_value(protocol, 200),
+            "device_id": "tempctl0",
+            "latency_ms": 200,
         },
     )
     assert_ok(resp, "inject_call_latency")
 
-    start = time.time()
+    start = time.perf_counter()
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "closed")},
+        {"mode": "closed"},
     )
     assert_ok(resp, "set_mode with injected latency")
-    injected_ms = (time.time() - start) * 1000
+    injected_ms = (time.perf_counter() - start) * 1000
 
     added_latency = injected_ms - baseline_ms
     assert added_latency >= 180, f"Expected ~200ms added latency, got {added_latency:.1f}ms"
@@ -149,14 +154,14 @@ def test_call_latency(client: AdppClient, protocol) -> bool:
     resp = client.call_function("chaos_control", 5, {})
     assert_ok(resp, "clear_faults")
 
-    start = time.time()
+    start = time.perf_counter()
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "open")},
+        {"mode": "open"},
     )
     assert_ok(resp, "set_mode after clear_faults")
-    cleared_ms = (time.time() - start) * 1000
+    cleared_ms = (time.perf_counter() - start) * 1000
     assert cleared_ms < baseline_ms + 50, "Latency should be removed after clear_faults"
 
     print(f"OK: baseline={baseline_ms:.1f}ms injected={injected_ms:.1f}ms cleared={cleared_ms:.1f}ms")
@@ -170,7 +175,7 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "open")},
+        {"mode": "open"},
     )
     assert_ok(resp, "baseline set_mode")
 
@@ -178,9 +183,9 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
         "chaos_control",
         4,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "function_id": make_string_value(protocol, "1"),
-            "failure_rate": make_double_value(protocol, 1.0),
+            "device_id": "tempctl0",
+            "function_id": "1",
+            "failure_rate": 1.0,
         },
     )
     assert_ok(resp, "inject_call_failure 100%")
@@ -188,7 +193,7 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "closed")},
+        {"mode": "closed"},
     )
     assert resp.status.code != 1, "Function should fail with 100% failure rate"
 
@@ -196,9 +201,9 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
         "chaos_control",
         4,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "function_id": make_string_value(protocol, "1"),
-            "failure_rate": make_double_value(protocol, 0.0),
+            "device_id": "tempctl0",
+            "function_id": "1",
+            "failure_rate": 0.0,
         },
     )
     assert_ok(resp, "inject_call_failure 0%")
@@ -206,7 +211,7 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "open")},
+        {"mode": "open"},
     )
     assert_ok(resp, "set_mode after 0% failure")
 
@@ -216,7 +221,7 @@ def test_call_failure(client: AdppClient, protocol) -> bool:
     resp = client.call_function(
         "tempctl0",
         1,
-        {"mode": make_string_value(protocol, "closed")},
+        {"mode": "closed"},
     )
     assert_ok(resp, "set_mode after clear_faults")
 
@@ -232,8 +237,8 @@ def test_clear_faults(client: AdppClient, protocol) -> bool:
         "chaos_control",
         1,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "duration_ms": make_int64_value(protocol, 10000),
+            "device_id": "tempctl0",
+            "duration_ms": 10000,
         },
     )
     assert_ok(resp, "inject_device_unavailable long")
@@ -242,8 +247,8 @@ def test_clear_faults(client: AdppClient, protocol) -> bool:
         "chaos_control",
         3,
         {
-            "device_id": make_string_value(protocol, "motorctl0"),
-            "latency_ms": make_int64_value(protocol, 500),
+            "device_id": "motorctl0",
+            "latency_ms": 500,
         },
     )
     assert_ok(resp, "inject_call_latency motorctl0")
@@ -257,17 +262,17 @@ def test_clear_faults(client: AdppClient, protocol) -> bool:
     resp = client.describe_device("tempctl0")
     assert_ok(resp, "describe tempctl0 after clear")
 
-    start = time.time()
+    start = time.perf_counter()
     resp = client.call_function(
         "motorctl0",
         10,
         {
-            "motor_index": make_int64_value(protocol, 1),
-            "duty": make_double_value(protocol, 0.5),
+            "motor_index": 1,
+            "duty": 0.5,
         },
     )
     assert_ok(resp, "motorctl call after clear")
-    latency_ms = (time.time() - start) * 1000
+    latency_ms = (time.perf_counter() - start) * 1000
     assert latency_ms < 100, f"Latency should be cleared, got {latency_ms:.1f}ms"
 
     print("OK: clear_faults removed all injections")
@@ -282,20 +287,23 @@ def test_multiple_devices(client: AdppClient, protocol) -> bool:
         "chaos_control",
         1,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "duration_ms": make_int64_value(protocol, 500),
+            "device_id": "tempctl0",
+            "duration_ms": 500,
         },
     )
     assert_ok(resp, "inject tempctl0 unavailable")
 
-    resp = client.describe_device("tempctl0")
-    assert resp.status.code != 1, "tempctl0 should be unavailable"
-
-    resp = client.describe_device("motorctl0")
-    assert_ok(resp, "describe motorctl0 while tempctl0 faulted")
-
-    resp = client.describe_device("relayio0")
-    assert_ok(resp, "describe relayio0 while tempctl0 faulted")
+    # The three isolation probes are independent, so send them as one pipelined write.
+    temp_resp, motor_resp, relay_resp = client.send_batch(
+        [
+            client.build_describe_device("tempctl0"),
+            client.build_describe_device("motorctl0"),
+            client.build_describe_device("relayio0"),
+        ]
+    )
+    assert temp_resp.status.code != 1, "tempctl0 should be unavailable"
+    assert_ok(motor_resp, "describe motorctl0 while tempctl0 faulted")
+    assert_ok(relay_resp, "describe relayio0 while tempctl0 faulted")
 
     resp = client.call_function("chaos_control", 5, {})
     assert_ok(resp, "clear_faults")
@@ -317,8 +325,8 @@ def test_invalid_inputs(client: AdppClient, protocol) -> bool:
         "chaos_control",
         1,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "duration_ms": make_int64_value(protocol, 0),
+            "device_id": "tempctl0",
+            "duration_ms": 0,
         },
     )
     assert resp.status.code == invalid_code, f"Expected invalid duration rejection, got {status_text(resp)}"
@@ -328,8 +336,8 @@ def test_invalid_inputs(client: AdppClient, protocol) -> bool:
         "chaos_control",
         3,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "latency_ms": make_int64_value(protocol, -5),
+            "device_id": "tempctl0",
+            "latency_ms": -5,
         },
     )
     assert resp.status.code == invalid_code, f"Expected invalid latency rejection, got {status_text(resp)}"
@@ -339,9 +347,9 @@ def test_invalid_inputs(client: AdppClient, protocol) -> bool:
         "chaos_control",
         4,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "function_id": make_string_value(protocol, "abc"),
-            "failure_rate": make_double_value(protocol, 0.5),
+            "device_id": "tempctl0",
+            "function_id": "abc",
+            "failure_rate": 0.5,
         },
     )
     assert resp.status.code == invalid_code, f"Expected invalid function_id rejection, got {status_text(resp)}"
@@ -351,9 +359,9 @@ def test_invalid_inputs(client: AdppClient, protocol) -> bool:
         "chaos_control",
         4,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "function_id": make_string_value(protocol, "1"),
-            "failure_rate": make_double_value(protocol, 1.2),
+            "device_id": "tempctl0",
+            "function_id": "1",
+            "failure_rate": 1.2,
         },
     )
     assert resp.status.code == invalid_code, f"Expected invalid failure_rate rejection, got {status_text(resp)}"
@@ -363,9 +371,9 @@ def test_invalid_inputs(client: AdppClient, protocol) -> bool:
         "chaos_control",
         4,
         {
-            "device_id": make_string_value(protocol, "tempctl0"),
-            "function_id": make_string_value(protocol, "1"),
-            "failure_rate": make_double_value(protocol, -0.1),
+            "device_id": "tempctl0",
+            "function_id": "1",
+            "failure_rate": -0.1,
         },
     )
     assert resp.status.code == invalid_code, f"Expected negative failure_rate rejection, got {status_text(resp)}"
@@ -385,6 +393,32 @@ def _new_client(protocol, exe_path, config_path) -> AdppClient:
     return client
 
 
+# Devices the tests inject faults into; each must describe cleanly before reuse.
+FAULTED_DEVICES = ("tempctl0", "motorctl0", "relayio0")
+
+
+def _reset_for_next_test(client: AdppClient) -> AdppClient | None:
+    """Clear chaos state so the provider can be reused; drop it if that fails.
+
+    Only called after a passing test: a test that raised may leave unread
+    responses behind, so its provider is never reused.
+    """
+    try:
+        if client.is_running():
+            resp = client.call_function("chaos_control", 5, {})
+            if resp.status.code != OK_CODE:
+                raise RuntimeError(status_text(resp))
+            describes = client.send_batch([client.build_describe_device(device) for device in FAULTED_DEVICES])
+            for device, describe_resp in zip(FAULTED_DEVICES, describes):
+                if describe_resp.status.code != OK_CODE:
+                    raise RuntimeError(f"describe {device} after clear: {status_text(describe_resp)}")
+            return client
+    except Exception as exc:
+        print(f"  reset failed ({exc}); respawning provider", file=sys.stderr)
+    client.close()
+    return None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Fault injection tests for anolis-provider-sim")
     parser.add_argument(
@@ -427,21 +461,30 @@ def main() -> int:
         print("Running all fault injection tests...")
         results: list[tuple[str, bool]] = []
 
-        for name, test_fn in tests.items():
-            client = None
-            try:
-                client = _new_client(protocol, exe_path, config_path)
-                test_fn(client)
-                results.append((name, True))
-            except Exception as exc:
-                print(f"FAIL: {name} - {exc}", file=sys.stderr)
-                if client is not None:
-                    print("Provider stderr tail:", file=sys.stderr)
-                    print(client.output_tail(120) or "(empty)", file=sys.stderr)
-                results.append((name, False))
-            finally:
-                if client is not None:
-                    client.close()
+        # One provider serves consecutive passing tests; clear_faults plus a
+        # describe of the faulted devices restores and confirms a clean chaos
+        # state. A failed test or reset gets a fresh provider for the next test.
+        shared: AdppClient | None = None
+        try:
+            for name, test_fn in tests.items():
+                try:
+                    if shared is None:
+                        shared = _new_client(protocol, exe_path, config_path)
+                    test_fn(shared)
+                    results.append((name, True))
+                except Exception as exc:
+                    print(f"FAIL: {name} - {exc}", file=sys.stderr)
+                    if shared is not None:
+                        print("Provider stderr tail:", file=sys.stderr)
+                        print(shared.output_tail(120) or "(empty)", file=sys.stderr)
+                        shared.close()
+                        shared = None
+                    results.append((name, False))
+                    continue
+                shared = _reset_for_next_test(shared)
+        finally:
+            if shared is not None:
+                shared.close()
 
         print("\n" + "=" * 50)
         print("Test Summary:")
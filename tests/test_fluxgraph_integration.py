@@ -22,10 +22,14 @@ from support.env import (
     resolve_fluxgraph_server,
     resolve_fluxgraph_provider_executable,
 )
-from support.framed_client import AdppClient, make_double_value, make_string_value
+from support.framed_client import AdppClient
 from support.process import ManagedTextProcess
 from support.proto_bootstrap import load_protocol_module
 
+SIM_DT_SEC = 0.1
+# Poll once per simulation tick so the rise is seen as soon as it happens.
+PROGRESS_POLL_SEC = SIM_DT_SEC
+
 
 def _read_temp(client: AdppClient, signal_id: str = "tc1_temp") -> float:
     resp = client.read_signals("tempctl0", [signal_id])
@@ -57,7 +61,7 @@ def run_fluxgraph_integration(duration: int, port: int) -> int:
 
     server = ManagedTextProcess.start(
         "fluxgraph-server",
-        [str(server_exe), "--port", str(port), "--dt", "0.1"],
+        [str(server_exe), "--port", str(port), "--dt", str(SIM_DT_SEC)],
     )
 
     client: AdppClient | None = None
@@ -74,13 +78,17 @@ def run_fluxgraph_integration(duration: int, port: int) -> int:
             sim_server=f"localhost:{port}",
         )
 
-        hello_resp = client.hello(
-            client_name="fluxgraph-integration-test",
-            client_version="1.0.0",
+        # Hello and WaitReady are independent, so pipeline them in one write.
+        hello_resp, ready_resp = client.send_batch(
+            [
+                client.build_hello(
+                    client_name="fluxgraph-integration-test",
+                    client_version="1.0.0",
+                ),
+                client.build_wait_ready(max_wait_ms_hint=5000),
+            ]
         )
         assert_ok(hello_resp, "hello")
-
-        ready_resp = client.wait_ready(max_wait_ms_hint=5000)
         assert_ok(ready_resp, "wait_ready")
 
         initial_temp = _read_temp(client)
@@ -90,28 +98,32 @@ def run_fluxgraph_integration(duration: int, port: int) -> int:
         resp = client.call_function(
             "tempctl0",
             1,
-            {"mode": make_string_value(protocol, "closed")},
+            {"mode": "closed"},
         )
         assert_ok(resp, "set_mode closed")
 
         resp = client.call_function(
             "tempctl0",
             2,
-            {"value": make_double_value(protocol, 80.0)},
+            {"value": 80.0},
         )
         assert_ok(resp, "set_setpoint 80")
 
-        deadline = time.time() + max(duration, 5)
+        start = time.monotonic()
+        deadline = start + max(duration, 5)
         max_temp = initial_temp
         samples = 0
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             current = _read_temp(client)
             max_temp = max(max_temp, current)
             samples += 1
             if current >= initial_temp + 1.0:
-                print(f"Observed temperature rise to {current:.2f} C after {samples} samples")
+                print(
+                    f"Observed temperature rise to {current:.2f} C after {samples} samples "
+                    f"({time.monotonic() - start:.1f}s)"
+                )
                 break
-            time.sleep(0.5)
+            time.sleep(PROGRESS_POLL_SEC)
         else:
             raise RuntimeError(
                 "Simulation progression assertion failed: chamber temperature did not rise by >= 1.0 C "
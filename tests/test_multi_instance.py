@@ -9,7 +9,7 @@ from pathlib import Path
 
 from support.assertions import assert_ok, list_devices_entries, require_signal
 from support.env import repo_root, resolve_config_path, resolve_provider_executable
-from support.framed_client import AdppClient, make_string_value
+from support.framed_client import AdppClient
 from support.proto_bootstrap import load_protocol_module
 
 
@@ -33,13 +33,14 @@ def test_multi_instance_independence(protocol, exe_path: Path, config_path: Path
         device_ids = [entry.device_id for entry in list_devices_entries(resp)]
         print(f"  Found devices: {device_ids}")
 
-        assert "tempctl0" in device_ids, "Missing tempctl0"
-        assert "tempctl1" in device_ids, "Missing tempctl1"
+        present = set(device_ids)
+        assert "tempctl0" in present, "Missing tempctl0"
+        assert "tempctl1" in present, "Missing tempctl1"
         print("  [PASS] Both tempctl0 and tempctl1 found\n")
 
         print("Test 2: Read initial modes")
-        resp0 = client.read_signals("tempctl0", ["control_mode"])
-        resp1 = client.read_signals("tempctl1", ["control_mode"])
+        # Both instances are read in one pipelined write; responses come back in order.
+        resp0, resp1 = client.read_signals_batch([("tempctl0", ["control_mode"]), ("tempctl1", ["control_mode"])])
         assert_ok(resp0, "read tempctl0 control_mode")
         assert_ok(resp1, "read tempctl1 control_mode")
 
@@ -49,8 +50,7 @@ def test_multi_instance_independence(protocol, exe_path: Path, config_path: Path
         print(f"  tempctl1 initial mode: {mode1_init}\n")
 
         print("Test 3: Verify configured initial temperatures")
-        temp0_resp = client.read_signals("tempctl0", ["tc1_temp"])
-        temp1_resp = client.read_signals("tempctl1", ["tc1_temp"])
+        temp0_resp, temp1_resp = client.read_signals_batch([("tempctl0", ["tc1_temp"]), ("tempctl1", ["tc1_temp"])])
         assert_ok(temp0_resp, "read tempctl0 tc1_temp")
         assert_ok(temp1_resp, "read tempctl1 tc1_temp")
 
@@ -64,24 +64,18 @@ def test_multi_instance_independence(protocol, exe_path: Path, config_path: Path
         print("  [PASS] Initial temperatures match config\n")
 
         print("Test 4: Set independent modes")
-        resp = client.call_function(
-            "tempctl0",
-            1,
-            {"mode": make_string_value(protocol, "closed")},
+        resp0, resp1 = client.send_batch(
+            [
+                client.build_call_function("tempctl0", 1, {"mode": "closed"}),
+                client.build_call_function("tempctl1", 1, {"mode": "open"}),
+            ]
         )
-        assert_ok(resp, "set tempctl0 mode closed")
-
-        resp = client.call_function(
-            "tempctl1",
-            1,
-            {"mode": make_string_value(protocol, "open")},
-        )
-        assert_ok(resp, "set tempctl1 mode open")
+        assert_ok(resp0, "set tempctl0 mode closed")
+        assert_ok(resp1, "set tempctl1 mode open")
         print("  [PASS] Mode change calls succeeded\n")
 
         print("Test 5: Verify state independence")
-        resp0 = client.read_signals("tempctl0", ["control_mode"])
-        resp1 = client.read_signals("tempctl1", ["control_mode"])
+        resp0, resp1 = client.read_signals_batch([("tempctl0", ["control_mode"]), ("tempctl1", ["control_mode"])])
         assert_ok(resp0, "read tempctl0 mode after set")
         assert_ok(resp1, "read tempctl1 mode after set")
 
@@ -11,10 +11,13 @@ Validates:
 from __future__ import annotations
 
 import argparse
-import queue
+import functools
+import os
 import sys
 import threading
 import time
+from types import ModuleType
+from typing import Any
 
 from support.assertions import assert_ok
 from support.env import (
@@ -24,13 +27,7 @@ from support.env import (
     resolve_fluxgraph_server,
     resolve_fluxgraph_provider_executable,
 )
-from support.framed_client import (
-    AdppClient,
-    make_bool_value,
-    make_double_value,
-    make_int64_value,
-    make_string_value,
-)
+from support.framed_client import AdppClient
 from support.process import ManagedTextProcess
 from support.proto_bootstrap import load_protocol_module
 
@@ -46,22 +43,34 @@ COUPLED_WINDOW_SEC = 20.0
 SAMPLE_PERIOD_SEC = 0.2
 
 
-def _read_signal(client: AdppClient, device_id: str, signal_id: str) -> float:
-    resp = client.read_signals(device_id, [signal_id])
+@functools.cache
+def _numeric_value_fields(protocol: ModuleType) -> dict[int, str]:
+    """Map numeric ValueType enums to their Value field, resolved once per protocol module."""
+    vtype = protocol.ValueType
+    return {
+        vtype.VALUE_TYPE_DOUBLE: "double_value",
+        vtype.VALUE_TYPE_INT64: "int64_value",
+        vtype.VALUE_TYPE_BOOL: "bool_value",
+    }
+
+
+def _decode_single(protocol: ModuleType, resp: Any, device_id: str, signal_id: str) -> float:
+    """Validate a single-signal ReadSignals response and return its numeric value."""
     assert_ok(resp, f"read_signals {device_id}/{signal_id}")
     values = resp.read_signals.values
     if len(values) != 1:
         raise RuntimeError(f"Expected one value for {device_id}/{signal_id}, got {len(values)}")
 
     value = values[0].value
-    vtype = client.protocol.ValueType
-    if value.type == vtype.VALUE_TYPE_DOUBLE:
-        return float(value.double_value)
-    if value.type == vtype.VALUE_TYPE_INT64:
-        return float(value.int64_value)
-    if value.type == vtype.VALUE_TYPE_BOOL:
-        return 1.0 if value.bool_value else 0.0
-    raise RuntimeError(f"Unsupported value type for {device_id}/{signal_id}: {value.type}")
+    field = _numeric_value_fields(protocol).get(value.type)
+    if field is None:
+        raise RuntimeError(f"Unsupported value type for {device_id}/{signal_id}: {value.type}")
+    return float(getattr(value, field))
+
+
+def _read_signal(client: AdppClient, device_id: str, signal_id: str, into: Any | None = None) -> float:
+    resp = client.read_signals(device_id, [signal_id], into=into)
+    return _decode_single(client.protocol, resp, device_id, signal_id)
 
 
 def average_material_window(
@@ -70,51 +79,72 @@ def average_material_window(
     duration_sec: float,
     sample_period_sec: float,
 ) -> tuple[float, int]:
-    samples: list[float] = []
+    # Running mean: the window only needs the average, not the sample history.
+    sample_count = 0
+    mean_temp = 0.0
     chamber_reads = 0
-    deadline = time.time() + duration_sec
-
-    while time.time() < deadline:
-        samples.append(_read_signal(extruder_client, "tempctl1", "tc2_temp"))
-        _read_signal(chamber_client, "tempctl0", "tc1_temp")
+    deadline = time.monotonic() + duration_sec
+    # Each sample is reduced to a float immediately, so one Response per client
+    # is parsed in place for the whole window.
+    extruder_scratch = extruder_client.protocol.Response()
+    chamber_scratch = chamber_client.protocol.Response()
+
+    while time.monotonic() < deadline:
+        # The chamber read only keeps that provider exercised; let it run while
+        # the extruder round trip is in flight rather than after it.
+        chamber_client.submit_read_signals("tempctl0", ["tc1_temp"])
+        sample = _read_signal(extruder_client, "tempctl1", "tc2_temp", extruder_scratch)
+        _decode_single(chamber_client.protocol, chamber_client.collect(into=chamber_scratch), "tempctl0", "tc1_temp")
+        sample_count += 1
+        mean_temp += (sample - mean_temp) / sample_count
         chamber_reads += 1
-        time.sleep(sample_period_sec)
+        # Never sleep past the window end just to discover it has closed.
+        time.sleep(min(sample_period_sec, max(0.0, deadline - time.monotonic())))
 
-    if not samples:
+    if not sample_count:
         raise RuntimeError("No samples collected for material temperature window")
 
-    return (sum(samples) / len(samples), chamber_reads)
+    return (mean_temp, chamber_reads)
 
 
-def _wait_ready_parallel(
-    chamber: AdppClient,
-    extruder: AdppClient,
-    timeout_sec: float = 30.0,
-) -> None:
-    errors: queue.Queue[tuple[str, Exception]] = queue.Queue()
+def _wait_ready_parallel(chamber: AdppClient, extruder: AdppClient) -> None:
+    """Run WaitReady on both providers concurrently.
 
-    def run(name: str, client: AdppClient) -> None:
-        try:
-            resp = client.wait_ready(max_wait_ms_hint=5000)
-            assert_ok(resp, f"{name} wait_ready")
-        except Exception as exc:
-            errors.put((name, exc))
+    Both requests are submitted before either reply is collected, so the
+    providers come up side by side. Each client's response timeout bounds its
+    collect(), except on Windows: pipes there cannot be select()ed, so the
+    collects run on a worker thread joined with the same bound instead.
+    """
+    clients = (("chamber-provider", chamber), ("extruder-provider", extruder))
+    for _, client in clients:
+        client.submit_request(client.build_wait_ready(max_wait_ms_hint=5000))
 
-    chamber_t = threading.Thread(target=run, args=("chamber-provider", chamber))
-    extruder_t = threading.Thread(target=run, args=("extruder-provider", extruder))
+    def collect_all() -> None:
+        for name, client in clients:
+            assert_ok(client.collect(), f"{name} wait_ready")
 
-    chamber_t.start()
-    extruder_t.start()
+    if os.name != "nt":
+        collect_all()
+        return
 
-    chamber_t.join(timeout=timeout_sec)
-    extruder_t.join(timeout=timeout_sec)
+    errors: list[Exception] = []
 
-    if chamber_t.is_alive() or extruder_t.is_alive():
-        raise RuntimeError(f"wait_ready timed out after {timeout_sec:.1f}s")
+    def run() -> None:
+        try:
+            collect_all()
+        except Exception as exc:
+            errors.append(exc)
 
-    if not errors.empty():
-        name, exc = errors.get()
-        raise RuntimeError(f"{name} wait_ready failed: {exc}")
+    timeout_sec = max(client.response_timeout for _, client in clients)
+    # Daemon: on timeout the worker stays blocked in a pipe read until the
+    # caller closes the providers.
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    worker.join(timeout=timeout_sec)
+    if worker.is_alive():
+        raise RuntimeError(f"wait_ready timed out after {timeout_sec:g}s")
+    if errors:
+        raise errors[0]
 
 
 def run_scenario(port: int) -> int:
@@ -166,7 +196,7 @@ def run_scenario(port: int) -> int:
             extruder.call_function(
                 "tempctl1",
                 FN_SET_MODE,
-                {"mode": make_string_value(protocol, "closed")},
+                {"mode": "closed"},
             ),
             "extruder set_mode closed",
         )
@@ -174,7 +204,7 @@ def run_scenario(port: int) -> int:
             extruder.call_function(
                 "tempctl1",
                 FN_SET_SETPOINT,
-                {"value": make_double_value(protocol, 230.0)},
+                {"value": 230.0},
             ),
             "extruder set_setpoint 230",
         )
@@ -184,7 +214,7 @@ def run_scenario(port: int) -> int:
             chamber.call_function(
                 "tempctl0",
                 FN_SET_MODE,
-                {"mode": make_string_value(protocol, "open")},
+                {"mode": "open"},
             ),
             "chamber set_mode open",
         )
@@ -193,8 +223,8 @@ def run_scenario(port: int) -> int:
                 "tempctl0",
                 FN_SET_RELAY,
                 {
-                    "relay_index": make_int64_value(protocol, 1),
-                    "state": make_bool_value(protocol, False),
+                    "relay_index": 1,
+                    "state": False,
                 },
             ),
             "chamber relay1 off",
@@ -204,8 +234,8 @@ def run_scenario(port: int) -> int:
                 "tempctl0",
                 FN_SET_RELAY,
                 {
-                    "relay_index": make_int64_value(protocol, 2),
-                    "state": make_bool_value(protocol, False),
+                    "relay_index": 2,
+                    "state": False,
                 },
             ),
             "chamber relay2 off",
@@ -234,7 +264,7 @@ def run_scenario(port: int) -> int:
             chamber.call_function(
                 "tempctl0",
                 FN_SET_MODE,
-                {"mode": make_string_value(protocol, "closed")},
+                {"mode": "closed"},
             ),
             "chamber set_mode closed",
         )
@@ -242,7 +272,7 @@ def run_scenario(port: int) -> int:
             chamber.call_function(
                 "tempctl0",
                 FN_SET_SETPOINT,
-                {"value": make_double_value(protocol, 50.0)},
+                {"value": 50.0},
             ),
             "chamber set_setpoint 50",
         )
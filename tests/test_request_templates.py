@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Request template tests for the ADPP framed client.
+
+Covers:
+- templated ListDevices, DescribeDevice, ReadSignals, GetHealth and scalar
+  CallFunction payloads match freshly built requests byte for byte
+- scalar call arguments keep their type and sign through the template cache
+  (bool/int/float, 0.0 vs -0.0)
+- the provider answers templated and freshly built requests identically
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import math
+import sys
+from typing import Any, Callable
+
+from support.assertions import assert_ok, read_signal_entries
+from support.env import repo_root, resolve_config_path, resolve_provider_executable
+from support.framed_client import AdppClient
+from support.proto_bootstrap import load_protocol_module
+
+# Each case is sent twice: the first call serializes the template, the second reuses it.
+CALL_ARG_CASES: tuple[dict[str, Any] | None, ...] = (
+    None,
+    {"mode": "closed"},
+    {"relay_index": 1, "state": True},
+    {"relay_index": 2, "state": False},
+    {"value": 80.0},
+    {"value": 0.0},
+    {"value": -0.0},
+    {"target": 25.5, "index": 2, "enabled": False, "label": "x"},
+)
+# True == 1 == 1.0 and 0.0 == -0.0, but none of them may share a template.
+EQUAL_ARG_VALUES: tuple[Any, ...] = (1, True, 1.0, 0.0, -0.0, 0.0)
+
+
+def _parse_request(client: AdppClient, payload: bytes | None) -> Any:
+    assert payload is not None, "scalar call_function arguments were not templated"
+    request = client.protocol.Request()
+    request.ParseFromString(payload)
+    return request
+
+
+def _assert_same_request(client: AdppClient, payload: bytes | None, expected: Any, context: str) -> Any:
+    sent = _parse_request(client, payload)
+    expected.request_id = sent.request_id
+    # Compare bytes: message equality treats -0.0 and 0.0 as equal.
+    if sent.SerializeToString(deterministic=True) != expected.SerializeToString(deterministic=True):
+        raise AssertionError(f"{context}: templated payload differs from built request\nsent: {sent}built: {expected}")
+    return sent
+
+
+def test_payloads(client: AdppClient) -> bool:
+    """Verify every templated payload matches the equivalent built request."""
+    print("\n=== Test 1: Templated Payloads ===")
+
+    cases: list[tuple[str, Callable[[], bytes | None], Callable[[], Any]]] = [
+        ("list_devices", functools.partial(client._list_devices_payload, False), client.build_list_devices),
+        (
+            "list_devices health",
+            functools.partial(client._list_devices_payload, True),
+            functools.partial(client.build_list_devices, True),
+        ),
+        ("get_health", client._get_health_payload, client.build_get_health),
+    ]
+    for device_id in ("tempctl0", "motorctl0"):
+        cases.append(
+            (
+                f"describe_device {device_id}",
+                functools.partial(client._describe_device_payload, device_id),
+                functools.partial(client.build_describe_device, device_id),
+            )
+        )
+    for signal_ids in (None, ["tc1_temp"], ["tc1_temp", "tc2_temp"]):
+        cases.append(
+            (
+                f"read_signals {signal_ids}",
+                functools.partial(client._read_signals_payload, "tempctl0", signal_ids),
+                functools.partial(client.build_read_signals, "tempctl0", signal_ids),
+            )
+        )
+    for args in CALL_ARG_CASES:
+        cases.append(
+            (
+                f"call_function {args}",
+                functools.partial(client._call_function_payload, "tempctl0", 3, args, None),
+                functools.partial(client.build_call_function, "tempctl0", 3, args),
+            )
+        )
+
+    for context, payload_fn, build_fn in cases:
+        first = _assert_same_request(client, payload_fn(), build_fn(), context)
+        second = _assert_same_request(client, payload_fn(), build_fn(), f"{context} (cached)")
+        assert second.request_id == first.request_id + 2, f"{context}: request_id not advanced"
+
+    print(f"OK: {len(cases)} templated payloads match built requests")
+    return True
+
+
+def test_argument_types(client: AdppClient, protocol) -> bool:
+    """Verify values that compare equal across types or signs keep separate templates."""
+    print("\n=== Test 2: Scalar Argument Types ===")
+
+    expected_types = {
+        bool: protocol.ValueType.VALUE_TYPE_BOOL,
+        int: protocol.ValueType.VALUE_TYPE_INT64,
+        float: protocol.ValueType.VALUE_TYPE_DOUBLE,
+    }
+    for value in EQUAL_ARG_VALUES:
+        payload = client._call_function_payload("tempctl0", 2, {"value": value}, None)
+        sent = _assert_same_request(
+            client, payload, client.build_call_function("tempctl0", 2, {"value": value}), f"value={value!r}"
+        )
+        arg = sent.call.args["value"]
+        assert arg.type == expected_types[type(value)], f"value={value!r}: wrong ValueType {arg.type}"
+        if isinstance(value, float):
+            assert math.copysign(1.0, arg.double_value) == math.copysign(1.0, value), f"value={value!r}: sign lost"
+
+    print("OK: bool/int/float and 0.0/-0.0 arguments keep their own templates")
+    return True
+
+
+def _comparable(resp: Any) -> bytes:
+    copy = type(resp)()
+    copy.CopyFrom(resp)
+    copy.request_id = 0
+    return bytes(copy.SerializeToString(deterministic=True))
+
+
+def test_provider_responses(client: AdppClient) -> bool:
+    """Verify the provider answers templated and built requests the same way."""
+    print("\n=== Test 3: Provider Responses ===")
+
+    for include_health in (False, True):
+        templated = client.list_devices(include_health)
+        built = client.send_request(client.build_list_devices(include_health))
+        assert_ok(templated, f"list_devices include_health={include_health}")
+        assert _comparable(templated) == _comparable(built), "list_devices responses differ"
+
+    templated = client.describe_device("tempctl0")
+    built = client.send_request(client.build_describe_device("tempctl0"))
+    assert_ok(templated, "describe_device tempctl0")
+    assert _comparable(templated) == _comparable(built), "describe_device responses differ"
+
+    signal_ids = ["tc1_temp", "relay1_state"]
+    templated = client.read_signals("tempctl0", signal_ids)
+    built = client.send_request(client.build_read_signals("tempctl0", signal_ids))
+    assert_ok(templated, "read_signals tempctl0")
+    assert_ok(built, "read_signals tempctl0 (built)")
+    for resp in (templated, built):
+        got = [entry.signal_id for entry in read_signal_entries(resp)]
+        assert got == signal_ids, f"read_signals returned {got}, expected {signal_ids}"
+
+    templated = client.get_health()
+    built = client.send_request(client.build_get_health())
+    assert templated.status.code == built.status.code, "get_health status differs"
+
+    for args in ({"mode": "open"}, {"relay_index": 1, "state": False}):
+        function_id = 1 if "mode" in args else 3
+        for _ in range(2):
+            templated = client.call_function("tempctl0", function_id, args)
+            assert_ok(templated, f"call_function {args}")
+        built = client.send_request(client.build_call_function("tempctl0", function_id, args))
+        assert _comparable(templated) == _comparable(built), f"call_function {args} responses differ"
+
+    print("OK: templated and built requests get identical responses")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Request template tests for the ADPP framed client")
+    parser.add_argument(
+        "--test",
+        default="all",
+        choices=["all", "payloads", "argument_types", "provider_responses"],
+        help="Test to run",
+    )
+    args = parser.parse_args()
+
+    protocol = load_protocol_module()
+    root = repo_root()
+    exe_path = resolve_provider_executable(root)
+    config_path = resolve_config_path("config/provider-sim.yaml", root)
+
+    if not config_path.exists():
+        print(f"ERROR: Config file not found: {config_path}", file=sys.stderr)
+        return 1
+
+    client = AdppClient(protocol, exe_path, config_path)
+    try:
+        hello_resp = client.hello(
+            client_name="request-template-test",
+            client_version="0.0.1",
+        )
+        assert_ok(hello_resp, "hello")
+
+        tests = {
+            "payloads": lambda c: test_payloads(c),
+            "argument_types": lambda c: test_argument_types(c, protocol),
+            "provider_responses": lambda c: test_provider_responses(c),
+        }
+        selected = list(tests) if args.test == "all" else [args.test]
+        results: list[tuple[str, bool]] = []
+        for name in selected:
+            try:
+                tests[name](client)
+                results.append((name, True))
+            except Exception as exc:
+                print(f"FAIL: {name} FAILED: {exc}", file=sys.stderr)
+                results.append((name, False))
+
+        print("\n" + "=" * 50)
+        print("Test Summary:")
+        for name, passed in results:
+            print(f"  {'PASS' if passed else 'FAIL'}: {name}")
+
+        if all(passed for _, passed in results):
+            print("\nAll request template tests passed!")
+            return 0
+
+        print("\nSome tests failed", file=sys.stderr)
+        print("Provider stderr tail:", file=sys.stderr)
+        print(client.output_tail(120) or "(empty)", file=sys.stderr)
+        return 1
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        print("Provider stderr tail:", file=sys.stderr)
+        print(client.output_tail(120) or "(empty)", file=sys.stderr)
+        return 1
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())